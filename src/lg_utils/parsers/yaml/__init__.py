@@ -1,7 +1,9 @@
+import re
 import json
 import yaml
-from typing import Type, TypeVar, List
+from typing import Any, Dict, Type, TypeVar, List
 import traceback
+from functools import lru_cache
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import BaseOutputParser
@@ -9,26 +11,41 @@ from langchain_core.runnables import Runnable
 from langchain_core.exceptions import OutputParserException
 from pydantic import BaseModel, ValidationError
 
+try:
+    import orjson
+
+    def _dumps_schema(schema: dict) -> str:
+        """Serialize a JSON schema for display in prompts (orjson fast path)."""
+        return orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps_schema(schema: dict) -> str:
+        """Serialize a JSON schema for display in prompts."""
+        return json.dumps(schema, indent=2)
+
 T = TypeVar("T", bound=BaseModel)
 
+_YAML_BLOCK_RE = re.compile(r"```(?:yaml)?\n(.*?)```", re.DOTALL)
+
+from lg_utils.parsers.yaml.utils import YAMLExtractor, _SafeLoader
+
 # Basic yaml content extractor. Keep for reference. We will use the version from yaml_utils
-def extract_yaml_content(text: str) -> str:
+def extract_yaml_content(text: str) -> Dict[str, Any]:
     """
     STUB: Replace this with your existing YAML extraction function.
     
     Current logic: 
     1. Tries to find ```yaml content ``` blocks.
-    2. Fallback: returns the whole text.
+    2. Fallback: uses the whole text.
+    3. Parses the YAML and returns it as a Dict.
     """
-    import re
-    pattern = re.compile(r"```(?:yaml)?\n(.*?)```", re.DOTALL)
-    match = pattern.search(text)
-    if match:
-        return match.group(1).strip()
-    return text.strip()
-
-# New implementation of yaml content extractor
-from lg_utils.parsers.yaml.utils import YAMLExtractor
+    match = _YAML_BLOCK_RE.search(text)
+    content = match.group(1).strip() if match else text.strip()
+    data = yaml.load(content, Loader=_SafeLoader)
+    if not isinstance(data, dict):
+        raise ValueError(f"YAML content is not a dictionary (got {type(data).__name__})")
+    return data
+
+# New implementation of yaml content extractor (also returns a Dict)
 extract_yaml_content = YAMLExtractor()
 
 
@@ -36,19 +53,16 @@ class YamlPydanticParser(BaseOutputParser[T]):
     pydantic_model: Type[T]
 
     def parse(self, text: str) -> T:
-        # Extract content
         try:
-            # Parse YAML string to Dict
+            # Extract and parse YAML to Dict, then validate against Pydantic
             data = extract_yaml_content(text)
-        except yaml.YAMLError as e:
-            raise OutputParserException(f"Invalid YAML Syntax: {e}")
-
-        try:
-            # Validate Dict against Pydantic
             return self.pydantic_model.model_validate(data)
         except ValidationError as e:
+            # Must come first: ValidationError is a ValueError subclass.
             # Raising OutputParserException is crucial for .with_retry() 
             raise OutputParserException(f"Schema Validation Failed: {e}")
+        except (yaml.YAMLError, ValueError) as e:
+            raise OutputParserException(f"Invalid YAML Syntax: {e}")
 
     @property
     def _type(self) -> str:
@@ -78,14 +92,21 @@ class YamlPydanticParser(BaseOutputParser[T]):
 #     raise ValueError("Input must be string or list of messages")
 
 
+# Parsers are stateless, so one instance per schema class can be shared.
+# Bounded, since dynamically created schemas (e.g. create_model) would otherwise accumulate.
+@lru_cache(maxsize=256)
+def _get_parser(schema: Type[BaseModel]) -> YamlPydanticParser:
+    return YamlPydanticParser(pydantic_model=schema)
+
+
 def with_custom_structured_output(self, schema: Type[BaseModel], **kwargs) -> Runnable:
     """
     This method is a wrapper around the `with_structured_output` method,
     but it uses a custom YAML parser instead of the default JSON parser.
     """
     
-    # Create the Parser Instance
-    parser = YamlPydanticParser(pydantic_model=schema)
+    # Reuse the Parser Instance per schema
+    parser = _get_parser(schema)
 
     # Create the Chain
     chain = ( self | parser )
@@ -115,7 +136,7 @@ if __name__ == '__main__':
         ingredients: List[Ingredient]
         difficulty: int = Field(description="1 to 10 scale")
 
-    schema_json = json.dumps(Recipe.model_json_schema(), indent=2)
+    schema_json = _dumps_schema(Recipe.model_json_schema())
 
     # 2. Initialize Model
     assert os.getenv('GOOGLE_API_KEY', os.getenv('GEMINI_API_KEY')) is not None, "env var GOOGLE_API_KEY not set"
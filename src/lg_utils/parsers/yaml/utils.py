@@ -1,12 +1,31 @@
 import re
 import yaml
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import logging
+import threading
 from markdown import Markdown
-from io import StringIO
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled patterns (avoid re-parsing the regex on every call)
+_BACKTICK_RE = re.compile(r'```(?:yaml|YAML)?\n((?:(?!\n```)[\s\S])*?)\n```', re.DOTALL)
+_DOC_SEPARATOR_RE = re.compile(r'^---$', re.MULTILINE)
+# Anything the markdown pipeline may rewrite: inline syntax, escapes/HTML/entities,
+# indented code, tabs (expanded anywhere), list markers, setext underlines and paragraph breaks
+_MARKDOWN_RE = re.compile(
+    r'[*_`\[#>\\<&]'
+    r'|^ {4}|\t'
+    r'|^ {0,3}(?:[-+=]|\d+[.)])'
+    r'|\n[ \t]*\n',
+    re.MULTILINE
+)
+
 # --- YAML Parsing Functions ---
 def parse_multiline_yaml(yaml_string: str) -> Optional[Dict[str, Any]]:
     """
@@ -17,7 +36,7 @@ def parse_multiline_yaml(yaml_string: str) -> Optional[Dict[str, Any]]:
         The parsed YAML as a Python dict, or None if parsing fails.
     """
     try:
-        data = yaml.safe_load(yaml_string)
+        data = yaml.load(yaml_string, Loader=_SafeLoader)
         if isinstance(data, dict):
             return data
         logger.warning(f"Warning: YAML segment is not a dictionary (got {type(data).__name__}).")
@@ -33,36 +52,40 @@ def parse_multiline_yaml(yaml_string: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Unexpected error parsing YAML: {e}")
         return None
 
-def extract_yaml_segments(text: str, remove_markdown: bool = False) -> List[Dict[str, Any]]:
+def _find_potential_segments(text: str) -> List[str]:
     """
-    Extracts all valid YAML segments from a given text string.
+    Finds candidate YAML strings in a given text: fenced blocks first (in the
+    order they appear), followed by the standalone blocks from the remaining text.
     Handles YAML in markdown-style code blocks and standalone YAML.
     """
-    pattern_in_backticks = r'```(?:yaml|YAML)?\n((?:(?!\n```)[\s\S])*?)\n```'
-    
     potential_segments = []
     
     # 1. Extract YAML from backticked blocks (Best Practice)
-    matches_in_backticks = list(re.finditer(pattern_in_backticks, text, re.DOTALL))
+    # Cheap substring probe first: skip the regex entirely when there is no fence
+    matches_in_backticks = list(_BACKTICK_RE.finditer(text)) if "```" in text else []
     for match in matches_in_backticks:
         segment_content = match.group(1).strip()
         if segment_content:
             potential_segments.append(segment_content)
 
     # 2. Remove backticked blocks from text
-    text_stripped = text
-    for match in reversed(matches_in_backticks):
-        text_stripped = text_stripped[:match.start()] + text_stripped[match.end():]
-    
-    text_stripped = text_stripped.strip()
+    # Single pass over the non-matching spans instead of re-slicing per match
+    parts = []
+    cursor = 0
+    for match in matches_in_backticks:
+        parts.append(text[cursor:match.start()])
+        cursor = match.end()
+    parts.append(text[cursor:])
+
+    text_stripped = "".join(parts).strip()
 
     # 3. Handle Standalone YAML (The Fix)
     # Don't split by double newlines (\n\n). Only split by valid YAML document separators (---).
     if text_stripped:
         # Check for standard YAML multi-document separators
-        if re.search(r'^---$', text_stripped, re.MULTILINE):
+        if _DOC_SEPARATOR_RE.search(text_stripped):
             # Split by document separator
-            standalone_blocks = re.split(r'^---$', text_stripped, flags=re.MULTILINE)
+            standalone_blocks = _DOC_SEPARATOR_RE.split(text_stripped)
         else:
             # Treat the remaining text as a single potential YAML block
             standalone_blocks = [text_stripped]
@@ -72,42 +95,55 @@ def extract_yaml_segments(text: str, remove_markdown: bool = False) -> List[Dict
             if stripped_block: 
                 potential_segments.append(stripped_block)
 
+    return potential_segments
+
+def _iter_segments(text: str, remove_markdown: bool = False, reverse: bool = False) -> Iterator[str]:
+    """Yields candidate YAML strings (optionally last to first), ready to be parsed."""
+    potential_segments = _find_potential_segments(text)
+    for segment in (reversed(potential_segments) if reverse else potential_segments):
+        # Only run the markdown pipeline when the segment has markdown syntax
+        if remove_markdown and _MARKDOWN_RE.search(segment):
+            segment = unmark(segment)
+        yield segment
+
+def extract_yaml_segments(text: str, remove_markdown: bool = False) -> List[Dict[str, Any]]:
+    """
+    Extracts all valid YAML segments from a given text string.
+    Handles YAML in markdown-style code blocks and standalone YAML.
+    """
     valid_segments = []
-    for segment in potential_segments:
-        processed_segment = segment
-        if remove_markdown:
-            processed_segment = unmark(processed_segment)
-        
-        parsed_data = parse_multiline_yaml(processed_segment)
+    for segment in _iter_segments(text, remove_markdown=remove_markdown):
+        parsed_data = parse_multiline_yaml(segment)
         if parsed_data is not None:
             valid_segments.append(parsed_data)
             
     return valid_segments
 
 # --- Markdown Unmarking Functions ---
-def _walk_element(element, stream: StringIO):
-    """Recursively writes element's text content to a stream."""
-    if element.text:
-        stream.write(element.text)
-    for sub_element in element:
-        _walk_element(sub_element, stream)
-    if element.tail:
-        stream.write(element.tail)
-
 def _unmark_element(element):
     """Convert a single element to plain text."""
-    stream = StringIO()
-    _walk_element(element, stream)
-    return stream.getvalue()
+    # Markdown builds an ElementTree, so itertext() walks it in C without recursion
+    text = "".join(element.itertext())
+    if element.tail:
+        text += element.tail
+    return text
 
 # Patch Markdown for plain text output
 Markdown.output_formats["plain"] = _unmark_element
-__md = Markdown(output_format="plain")
-__md.stripTopLevelTags = False
+# Markdown instances are stateful and not thread-safe; keep one per thread
+_md_local = threading.local()
+
+def _get_markdown() -> Markdown:
+    md = getattr(_md_local, "md", None)
+    if md is None:
+        md = Markdown(output_format="plain")
+        md.stripTopLevelTags = False
+        _md_local.md = md
+    return md
 
 def unmark(text: str) -> str:
     """Converts markdown text to plain text."""
-    return __md.convert(text)
+    return _get_markdown().reset().convert(text)
 
 class YAMLExtractor:
     """Base class for extracting and filtering YAML data."""
@@ -120,6 +156,7 @@ class YAMLExtractor:
                       and are valid. Can be "first" or "last".
         """
         self.mandatory_keys = mandatory_keys or []
+        self._mandatory = frozenset(self.mandatory_keys)
         if strategy not in ["first", "last"]:
             raise ValueError("Strategy must be 'first' or 'last'")
         self.strategy = strategy
@@ -138,15 +175,17 @@ class YAMLExtractor:
             # Filter mode: remove candidates that don't match, keep the valid ones.
             candidates = [
                 candidate for candidate in candidates
-                if all(key in candidate for key in self.mandatory_keys)
+                if self._mandatory <= candidate.keys()
             ]
         else:
             # Strict mode: All extracted YAML segments MUST contain the mandatory keys.
             # If we found YAML blocks but they are incomplete, this is an error.
             for i, candidate in enumerate(candidates):
+                if self._mandatory <= candidate.keys():
+                    continue
+                # Keep the configured key order in the error message
                 missing_keys = [key for key in self.mandatory_keys if key not in candidate]
-                if missing_keys:
-                    raise ValueError(f"YAML segment {i+1} is missing mandatory keys: {missing_keys}")
+                raise ValueError(f"YAML segment {i+1} is missing mandatory keys: {missing_keys}")
         
         return candidates
 
@@ -155,7 +194,21 @@ class YAMLExtractor:
         Processes text, extracts YAML, and returns the selected document
         based on the defined strategy.
         """
-        candidates = self.extract_from_text(text.strip(), **kwargs)
+        # Fast path: without validation only the selected document matters,
+        # so stop at the first segment that parses (scanning from the chosen end).
+        # Extra kwargs and subclasses overriding extract_from_text take the full path.
+        if (
+            not self.mandatory_keys
+            and not kwargs
+            and type(self).extract_from_text is YAMLExtractor.extract_from_text
+        ):
+            for segment in _iter_segments(text.strip(), reverse=self.strategy == "last"):
+                parsed_data = parse_multiline_yaml(segment)
+                if parsed_data is not None:
+                    return parsed_data
+            candidates = []
+        else:
+            candidates = self.extract_from_text(text.strip(), **kwargs)
         
         if not candidates:
             # This error is raised if no YAML was found, or if all found YAML 
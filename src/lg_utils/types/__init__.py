@@ -1,6 +1,7 @@
 
 import logging
 import jinja2
+from functools import lru_cache
 from typing import Dict, Any, Callable, Optional
 from langchain.messages import HumanMessage, SystemMessage
 from tenacity import (
@@ -10,6 +11,21 @@ from tenacity import (
     Retrying
 )
 
+# Shared environment so agents built from the same strings share compiled templates
+_DEFAULT_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.BaseLoader(),
+    undefined=jinja2.StrictUndefined,
+    autoescape=False,
+    cache_size=1000,
+    auto_reload=False
+)
+
+@lru_cache(maxsize=1024)
+def _compile_template(env: jinja2.Environment, source: str) -> jinja2.Template:
+    """Memoized `env.from_string` (jinja2 does not cache string templates itself)."""
+    return env.from_string(source)
+
+
 class StructuredAgent:
     def __init__(
         self, 
@@ -31,18 +47,14 @@ class StructuredAgent:
         if llm is None:
             from langchain.chat_models import init_chat_model
             llm = init_chat_model(model_name)
-            self.llm = llm
+        self.llm = llm
         
         # Setup Jinja2
-        self.jinja2_env = jinja2_env or jinja2.Environment(
-            loader=jinja2.BaseLoader,
-            undefined=jinja2.StrictUndefined,
-            autoescape=False
-        )
+        self.jinja2_env = jinja2_env or _DEFAULT_JINJA_ENV
         
-        # Pre-compile templates for performance
-        self.instruction_tmpl = self.jinja2_env.from_string(instruction)
-        self.system_tmpl = self.jinja2_env.from_string(description) if description else None
+        # Pre-compile templates for performance (shared across agents)
+        self.instruction_tmpl = _compile_template(self.jinja2_env, instruction)
+        self.system_tmpl = _compile_template(self.jinja2_env, description) if description else None
         
         self.prompt_defaults = prompt_defaults or {}
         self.post_processor = post_processor or (lambda x: {"output": x})
@@ -52,12 +64,25 @@ class StructuredAgent:
         self.retry_configs = {**default_retry, **(retry_configs or {})}
         self.pp_retry_configs = {**default_retry, **(post_process_retry_configs or {})}
 
-        self._llm_retryer = self._build_retryer(self.retry_configs, Exception, self._log_retry_attempt)
-        self._pp_retryer = self._build_retryer(
-            self.pp_retry_configs, 
-            (ValueError, KeyError, TypeError, RuntimeError), 
-            self._log_post_process_retry
-        )
+        # Retryers are built lazily on first call
+        self._llm_retryer_instance = None
+        self._pp_retryer_instance = None
+
+    @property
+    def _llm_retryer(self):
+        if self._llm_retryer_instance is None:
+            self._llm_retryer_instance = self._build_retryer(self.retry_configs, Exception, self._log_retry_attempt)
+        return self._llm_retryer_instance
+
+    @property
+    def _pp_retryer(self):
+        if self._pp_retryer_instance is None:
+            self._pp_retryer_instance = self._build_retryer(
+                self.pp_retry_configs, 
+                (ValueError, KeyError, TypeError, RuntimeError), 
+                self._log_post_process_retry
+            )
+        return self._pp_retryer_instance
 
     def _build_retryer(self, configs, exc_types, hook):
         return Retrying(
@@ -92,11 +117,11 @@ class StructuredAgent:
         
         payloads = {**self.prompt_defaults, **state, **runtime_var}
         
-        # 2. Render Messages
+        # 2. Render Messages (pass the dict positionally to avoid a **kwargs repack)
         input_messages = []
         if self.system_tmpl:
-            input_messages.append(SystemMessage(content=self.system_tmpl.render(**payloads)))
-        input_messages.append(HumanMessage(content=self.instruction_tmpl.render(**payloads)))
+            input_messages.append(SystemMessage(content=self.system_tmpl.render(payloads)))
+        input_messages.append(HumanMessage(content=self.instruction_tmpl.render(payloads)))
 
         # 3. Execute with Post-Processing Retries
         try:
@@ -2,6 +2,52 @@ import logging
 from transformers import PreTrainedTokenizer
 
 # --- Text Truncation Function ---
+def _enforce_token_limit(
+    text: str,
+    tokenizer: PreTrainedTokenizer,
+    max_tokens: int
+) -> str:
+    """
+    Re-tokenizes the final text and hard-cuts it to max_tokens if needed.
+    Text and ellipsis may tokenize differently once joined, so this is the
+    last check behind every truncation path.
+    """
+    final_tokens = tokenizer(text, add_special_tokens=False)['input_ids']
+    if len(final_tokens) > max_tokens:
+        return tokenizer.decode(final_tokens[:max_tokens], skip_special_tokens=True)
+    return text
+# end def
+
+def _truncate_by_offsets(
+    text: str,
+    tokenizer: PreTrainedTokenizer,
+    max_tokens: int,
+    ellipsis: str
+) -> str:
+    """
+    Truncates text with a single tokenizer pass using the character offsets
+    returned by HuggingFace fast tokenizers.
+    """
+    encoding = tokenizer(text, return_offsets_mapping=True, add_special_tokens=False)
+    offsets = encoding['offset_mapping']
+    if len(offsets) <= max_tokens:
+        return text
+
+    # Reserve room for the ellipsis when possible, otherwise drop it
+    ellipsis_tokens = len(tokenizer(ellipsis, add_special_tokens=False)['input_ids'])
+    keep_tokens = max_tokens - ellipsis_tokens
+
+    # Cut at the start of the first dropped token. (Byte-level tokens of one
+    # character share its span, so cutting at the end of the last kept token
+    # could keep a whole character that was only partly within the limit.)
+    if keep_tokens <= 0:
+        truncated = text[:offsets[max_tokens][0]].rstrip()
+    else:
+        truncated = text[:offsets[keep_tokens][0]].rstrip() + ellipsis
+
+    return _enforce_token_limit(truncated, tokenizer, max_tokens)
+# end def
+
 def truncate_text_to_token_limit(
     text: str,
     tokenizer: PreTrainedTokenizer,
@@ -30,8 +76,7 @@ def truncate_text_to_token_limit(
         ValueError: If max_tokens is non-positive or text is empty after processing.
     """
 
-    if logging is None:
-        logging.basicConfig(level=logging.INFO)
+    if logger is None:
         logger = logging.getLogger(__name__)
     # end if
 
@@ -42,54 +87,57 @@ def truncate_text_to_token_limit(
     if not stripped_text:
         return stripped_text
 
+    # Fast tokenizers: tokenize once and cut in token space
+    if getattr(tokenizer, "is_fast", False):
+        try:
+            return _truncate_by_offsets(stripped_text, tokenizer, max_tokens, ellipsis)
+        except Exception as e:
+            logger.error(f"Tokenizer error: {e}")
+            return stripped_text # Return original if tokenizer fails
+
     # Initial token count to check if truncation is needed
     try:
-        initial_tokens = tokenizer(stripped_text, return_tensors="pt")['input_ids']
+        initial_tokens = tokenizer(stripped_text, add_special_tokens=False)['input_ids']
     except Exception as e:
         logger.error(f"Tokenizer error: {e}")
         return stripped_text # Return original if tokenizer fails
 
-    if initial_tokens.shape[-1] <= max_tokens:
+    if len(initial_tokens) <= max_tokens:
         return stripped_text
 
-    # Reduce text proportionally based on token count
     words = stripped_text.split()
     if not words:
         return stripped_text # Should not happen if stripped_text is not empty
 
-    # Estimate words to keep, ensuring at least one word remains.
-    # Calculate target word count based on ratio of max_tokens to initial_tokens.
-    # Ensure target_word_count is at least 1 to prevent empty output.
-    estimated_target_words = max(1, int(len(words) * max_tokens / initial_tokens.shape[-1]))
-    words_to_keep = words[:estimated_target_words]
-
-    # Iteratively refine by removing words until token limit is met
-    current_text = " ".join(words_to_keep)
-    while len(tokenizer(current_text, return_tensors="pt")['input_ids']) > max_tokens:
-        if len(words_to_keep) <= 1: # Cannot truncate further
-            break
-        words_to_keep.pop() # Remove the last word
-        current_text = " ".join(words_to_keep)
-        if verbose:
-            logger.info(f"Truncating... Remaining words: {len(words_to_keep)}")
+    def fits(num_words: int, suffix: str = "") -> bool:
+        # Plain Python lists are enough to count tokens; no tensor needed
+        candidate = " ".join(words[:num_words]) + suffix
+        return len(tokenizer(candidate, add_special_tokens=False)['input_ids']) <= max_tokens
+
+    def longest_fitting_prefix(hi: int, suffix: str = "") -> int:
+        # Binary search for the largest word count that fits, keeping at least one word
+        lo = 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fits(mid, suffix):
+                lo = mid
+            else:
+                hi = mid - 1
+            if verbose:
+                logger.info(f"Truncating... Search window: {lo}-{hi} words")
+        return lo
+
+    # The full text does not fit, so search among strictly shorter prefixes
+    num_words = longest_fitting_prefix(len(words) - 1) if len(words) > 1 else 1
+    current_text = " ".join(words[:num_words])
 
     # Add ellipsis if truncation occurred and there's space
     final_text_with_ellipsis = current_text
-    if len(words) > len(words_to_keep): # If actual truncation happened
+    if len(words) > num_words: # If actual truncation happened
         try:
-            # Check if ellipsis fits
-            ellipsis_tokens = len(tokenizer(ellipsis, return_tensors="pt")['input_ids'])
-            if len(tokenizer(current_text, return_tensors="pt")['input_ids']) + ellipsis_tokens <= max_tokens:
-                final_text_with_ellipsis += ellipsis
-            else:
-                # If ellipsis doesn't fit, try to truncate current_text more to make space
-                while len(tokenizer(final_text_with_ellipsis, return_tensors="pt")['input_ids']) + ellipsis_tokens > max_tokens:
-                    if len(words_to_keep) <= 1:
-                        break # Cannot make space for ellipsis
-                    words_to_keep.pop()
-                    final_text_with_ellipsis = " ".join(words_to_keep)
-                if len(final_text_with_ellipsis) > 0: # Only add if there's text left
-                    final_text_with_ellipsis += ellipsis
+            # Shrink further (if needed) so the ellipsis fits as well
+            num_words = longest_fitting_prefix(num_words, ellipsis)
+            final_text_with_ellipsis = " ".join(words[:num_words]) + ellipsis
 
         except Exception as e:
             logger.error(f"Tokenizer error while adding ellipsis: {e}")
@@ -97,8 +145,4 @@ def truncate_text_to_token_limit(
 
     # Ensure final output adheres to max_tokens. This is a safeguard.
     # If the logic above somehow fails, this re-truncates to the absolute limit.
-    final_tokens = tokenizer(final_text_with_ellipsis, return_tensors="pt")['input_ids']
-    if final_tokens.shape[-1] > max_tokens:
-        return tokenizer.decode(final_tokens[0, :max_tokens], skip_special_tokens=True)
-        
-    return final_text_with_ellipsis
+    return _enforce_token_limit(final_text_with_ellipsis, tokenizer, max_tokens)
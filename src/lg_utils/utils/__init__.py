@@ -1,12 +1,17 @@
 import os
-import glob
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable
 
+# Directory of this module, resolved once instead of walking the frame stack per call
+_DEFAULT_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def recursive_load_files(
     file_extensions: list[str],
     parser: Optional[Callable[[str], Any]] = None,
-    root_dir: Optional[str] = None
+    root_dir: Optional[str] = None,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Recursively loads files with given extensions into a nested dictionary.
@@ -17,23 +22,51 @@ def recursive_load_files(
         parser: Function to parse file content (e.g., `yaml.safe_load` for YAML).
                 If `None`, reads files as plain text.
         root_dir: Root directory to search. Defaults to the script's directory.
+        max_workers: Number of threads used to read and parse files.
+                     Defaults to min(32, number of files).
 
     Returns:
         Nested dictionary where keys are path segments and values are parsed file contents.
     """
     # Set root directory (default: script's directory)
     if root_dir is None:
-        root_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+        root_dir = _DEFAULT_ROOT_DIR
 
-    # Find all matching files
+    # Find all matching files in a single traversal. As with the recursive glob,
+    # hidden entries are skipped and symlinked directories are followed.
+    extensions = tuple(file_extensions)
     files = []
-    for ext in file_extensions:
-        files.extend(glob.glob(os.path.join(root_dir, "**", f"*{ext}"), recursive=True))
+    # Directories are visited once by real path, which guards against symlink cycles
+    visited = {os.path.realpath(root_dir)}
+    for dirpath, dirnames, filenames in os.walk(root_dir, followlinks=True):
+        kept_dirnames = []
+        for d in dirnames:
+            if d.startswith("."):
+                continue
+            realpath = os.path.realpath(os.path.join(dirpath, d))
+            if realpath not in visited:
+                visited.add(realpath)
+                kept_dirnames.append(d)
+        dirnames[:] = kept_dirnames
+        for filename in filenames:
+            if not filename.startswith(".") and filename.endswith(extensions):
+                files.append(os.path.join(dirpath, filename))
+
+    def read_file(file: str) -> Any:
+        with open(file, "r") as f:
+            content = f.read()
+        return parser(content) if parser else content
+
+    # Read and optionally parse the files concurrently (I/O bound)
+    contents = []
+    if files:
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(files))) as executor:
+            contents = list(executor.map(read_file, files))
 
     # Initialize output dictionary
     file_registry = {}
 
-    for file in files:
+    for file, content in zip(files, contents):
         # Get relative path and remove extension
         relpath = os.path.relpath(file, root_dir)
         relpath_without_ext = os.path.splitext(relpath)[0]
@@ -46,10 +79,7 @@ def recursive_load_files(
                 current_level[part] = {}
             current_level = current_level[part]
 
-        # Read and optionally parse the file
-        with open(file, "r") as f:
-            content = f.read()
-            current_level[parts[-1]] = parser(content) if parser else content
+        current_level[parts[-1]] = content
 
     return file_registry
 # end def
@@ -58,6 +88,12 @@ def recursive_load_files(
 import inspect
 from typing import Dict, Any, Callable, Tuple, Optional, Union, List
 
+@lru_cache(maxsize=1024)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Memoized `inspect.signature`, keyed on the function object."""
+    return inspect.signature(func)
+# end def
+
 def get_function_arguments(
     func: Callable
 ) -> Dict[str, Dict[str, Union[type, Any, None]]]:
@@ -86,19 +122,25 @@ def get_function_arguments(
             'kwargs': {'type': None, 'default': <empty>, 'kind': 'VAR_KEYWORD'}
         }
     """
-    signature = inspect.signature(func)
+    try:
+        signature = _cached_signature(func)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        signature = inspect.signature(func)
     arguments = {}
 
     for name, param in signature.parameters.items():
         arguments[name] = {
-            'type': param.annotation if param.annotation != inspect.Parameter.empty else None,
-            'default': param.default if param.default != inspect.Parameter.empty else None,
+            'type': param.annotation if param.annotation is not inspect.Parameter.empty else None,
+            'default': param.default if param.default is not inspect.Parameter.empty else None,
             'kind': param.kind.name.lower()
         }
 
     return arguments
 # end def
 
+_MISSING = object()
+
 def get_nested_value(data, keys, default_value=None):
     """Get value from nested dict
     
@@ -111,7 +153,12 @@ def get_nested_value(data, keys, default_value=None):
         any: The nested value or the default value.
     """
     for key in keys:
-        if key in data:
+        if type(data) is dict:
+            # Single lookup for plain dicts (subclasses may override __contains__/__getitem__)
+            data = data.get(key, _MISSING)
+            if data is _MISSING:
+                return default_value
+        elif key in data:
             data = data[key]
         else:
             return default_value
@@ -120,14 +167,17 @@ def get_nested_value(data, keys, default_value=None):
     return data
 # end def
 
+@lru_cache(maxsize=1024)
+def _split_attribute_path(attribute_path: str) -> Tuple[str, ...]:
+    return tuple(attribute_path.split('.'))
+# end def
+
 def get_nested_attribute(obj, attribute_path, default_value=None):
     """Get value from nested object attribute    """
-    parts = attribute_path.split('.')
     current_obj = obj
-    for part in parts:
-        if hasattr(current_obj, part):
-            current_obj = getattr(current_obj, part)
-        else:
+    for part in _split_attribute_path(attribute_path):
+        current_obj = getattr(current_obj, part, _MISSING)
+        if current_obj is _MISSING:
             return default_value
     return current_obj
 # end def